@@ -1,20 +1,57 @@
 import asyncio
 import aiohttp
+import contextlib
+import operator
+import os
+import socket
+import sys
 import time
 import json
 from typing import List, Dict, Tuple, Optional
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 import logging
 from pathlib import Path
 import flet as ft
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Настройка логирования
 logging.basicConfig(level=logging.INFO,
                     format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+def install_uvloop():
+    """Установка uvloop вместо стандартного event loop (если доступен)"""
+    if os.name != "posix":
+        return
+    try:
+        import uvloop
+    except ImportError:
+        logger.debug("uvloop не установлен, используется стандартный loop")
+        return
+    uvloop.install()
+    logger.debug("uvloop установлен как event loop")
+
+
+def json_dumps(data) -> bytes:
+    """Сериализация в JSON: orjson (C-уровень), если доступен"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def json_loads(raw):
+    """Десериализация из JSON: orjson, если доступен"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+@dataclass(slots=True)
 class VLESSConfig:
     """Конфигурация VLESS сервера"""
     server: str
@@ -27,24 +64,106 @@ class VLESSConfig:
     status: str = "unknown"
     tag: str = ""
 
+    def to_dict(self) -> Dict:
+        """Плоский словарь полей (быстрее рекурсивного asdict)"""
+        return {
+            'server': self.server,
+            'server_port': self.server_port,
+            'uuid': self.uuid,
+            'server_name': self.server_name,
+            'path': self.path,
+            'speed_mbps': self.speed_mbps,
+            'latency_ms': self.latency_ms,
+            'status': self.status,
+            'tag': self.tag,
+        }
+
+
+class _TunedTCPConnector(aiohttp.TCPConnector):
+    """TCPConnector с настройкой сокетов под замер скорости"""
+
+    async def _wrap_create_connection(self, *args, **kwargs):
+        transport, proto = await super()._wrap_create_connection(*args, **kwargs)
+        sock = transport.get_extra_info('socket')
+        if sock is not None:
+            try:
+                # Без Nagle и с большим приёмным буфером окно TCP
+                # раскрывается быстрее — замер меньше занижает скорость
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                sock.setsockopt(
+                    socket.SOL_SOCKET, socket.SO_RCVBUF, 4 * 1024 * 1024)
+            except OSError:
+                pass
+        return transport, proto
+
 
 class VLESSChecker:
     """Класс для проверки VLESS серверов"""
 
-    def __init__(self, timeout: int = 10, test_size_mb: float = 1.0):
+    def __init__(self, timeout: int = 10, test_size_mb: float = 1.0,
+                 concurrency: int = 16, preflight_concurrency: int = 256):
         self.timeout = timeout
         self.test_size_bytes = int(test_size_mb * 1024 * 1024)
         self.test_url = "https://speed.cloudflare.com/__down?bytes=1048576"
+        # Замеры скорости конкурируют за полосу — держим их число низким;
+        # пинги дешёвые, их можно пускать широким фронтом
+        self.concurrency = concurrency
+        self.preflight_concurrency = preflight_concurrency
+        self._sem: Optional[asyncio.Semaphore] = None
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._dns_cache: Dict[str, str] = {}
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Ленивое создание общей HTTP-сессии для всех проверок"""
+        if self._session is None or self._session.closed:
+            connector = _TunedTCPConnector(
+                ssl=False,
+                limit=self.concurrency,
+                limit_per_host=16,
+                keepalive_timeout=30,
+                ttl_dns_cache=300,
+                use_dns_cache=True,
+                enable_cleanup_closed=True,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+        return self._session
+
+    async def close(self):
+        """Закрытие общей HTTP-сессии"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def _resolve(self, host: str) -> str:
+        """Резолв хоста в IP с кэшированием на время всей проверки"""
+        ip = self._dns_cache.get(host)
+        if ip is not None:
+            return ip
+        try:
+            infos = await asyncio.get_running_loop().getaddrinfo(
+                host, None, type=socket.SOCK_STREAM)
+            ip = infos[0][4][0]
+        except (OSError, socket.gaierror):
+            # Не удалось отрезолвить — пусть open_connection попробует сам
+            ip = host
+        self._dns_cache[host] = ip
+        return ip
 
     async def check_latency(self, host: str, port: int) -> Tuple[bool, float]:
         """Проверка латентности до сервера"""
         try:
-            start_time = time.time()
+            # Резолвим заранее, чтобы DNS не попадал в измерение латентности
+            ip = await self._resolve(host)
+            start_ns = time.perf_counter_ns()
             reader, writer = await asyncio.wait_for(
-                asyncio.open_connection(host, port),
+                asyncio.open_connection(ip, port),
                 timeout=self.timeout
             )
-            latency = (time.time() - start_time) * 1000
+            # Измеряем только окно установки соединения (SYN -> SYN/ACK)
+            latency = (time.perf_counter_ns() - start_ns) / 1_000_000
             writer.close()
             await writer.wait_closed()
             return True, latency
@@ -52,13 +171,69 @@ class VLESSChecker:
             logger.debug(f"Latency check failed for {host}:{port} - {e}")
             return False, 0.0
 
+    @staticmethod
+    async def _run_all(coros):
+        """Запуск набора корутин: TaskGroup на 3.11+, gather иначе"""
+        if sys.version_info >= (3, 11):
+            async with asyncio.TaskGroup() as tg:
+                tasks = [tg.create_task(coro) for coro in coros]
+            return [t.result() for t in tasks]
+        return list(await asyncio.gather(*coros))
+
+    async def _pre_flight(self, configs: List[VLESSConfig],
+                          progress_callback=None) -> List[VLESSConfig]:
+        """Быстрый отсев недоступных серверов до замера скорости"""
+        sem = asyncio.Semaphore(self.preflight_concurrency)
+
+        async def probe(config: VLESSConfig) -> bool:
+            async with sem:
+                if progress_callback:
+                    progress_callback(
+                        f"Пинг {config.server}:{config.server_port}...")
+                is_reachable, latency = await self.check_latency(
+                    config.server, config.server_port)
+                if is_reachable:
+                    config.latency_ms = latency
+                else:
+                    config.status = "unreachable"
+                    logger.warning(
+                        f"❌ {config.server}:{config.server_port} - недоступен")
+                return is_reachable
+
+        flags = await self._run_all([probe(config) for config in configs])
+        return [config for config, ok in zip(configs, flags) if ok]
+
     async def measure_speed(self, config: VLESSConfig, progress_callback=None) -> VLESSConfig:
         """Измерение скорости через прокси"""
-        try:
-            if progress_callback:
-                progress_callback(
-                    f"Проверка {config.server}:{config.server_port}...")
+        if self._sem is None:
+            self._sem = asyncio.Semaphore(self.concurrency)
+
+        if sys.version_info >= (3, 11):
+            # Жёсткий потолок на всю проверку: зависший handshake не
+            # держит задачу дольше timeout + 1
+            deadline = asyncio.timeout(self.timeout + 1)
+        else:
+            deadline = contextlib.nullcontext()
 
+        async with self._sem:
+            try:
+                async with deadline:
+                    return await self._measure_speed_inner(config, progress_callback)
+            except asyncio.TimeoutError:
+                config.status = "timeout"
+            except Exception as e:
+                config.status = "error"
+                logger.error(f"❌ {config.server}:{config.server_port} - {e}")
+
+            return config
+
+    async def _measure_speed_inner(self, config: VLESSConfig, progress_callback=None) -> VLESSConfig:
+        if progress_callback:
+            progress_callback(
+                f"Проверка {config.server}:{config.server_port}...")
+
+        # Латентность могла быть уже измерена на этапе pre-flight
+        if config.latency_ms == 0.0:
             is_reachable, latency = await self.check_latency(config.server, config.server_port)
 
             if not is_reachable:
@@ -69,95 +244,152 @@ class VLESSChecker:
 
             config.latency_ms = latency
 
-            connector = aiohttp.TCPConnector(ssl=False, force_close=True)
-            timeout = aiohttp.ClientTimeout(total=self.timeout)
-
-            async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
-                start_time = time.time()
-
-                async with session.get(self.test_url) as response:
-                    if response.status == 200:
-                        data = await response.read()
-                        elapsed_time = time.time() - start_time
-
-                        bytes_received = len(data)
-                        speed_mbps = (bytes_received /
-                                      (1024 * 1024)) / elapsed_time
-
-                        config.speed_mbps = round(speed_mbps, 2)
-                        config.status = "ok"
-
-                        logger.info(f"✅ {config.server}:{config.server_port} - "
-                                    f"Скорость: {config.speed_mbps} MB/s, "
-                                    f"Латентность: {config.latency_ms:.1f}ms")
-                    else:
-                        config.status = "error"
-
-        except asyncio.TimeoutError:
-            config.status = "timeout"
-        except Exception as e:
-            config.status = "error"
-            logger.error(f"❌ {config.server}:{config.server_port} - {e}")
+        session = await self._get_session()
+        start_time = time.perf_counter()
+
+        async with session.get(self.test_url) as response:
+            if response.status == 200:
+                # Читаем потоково: полезная нагрузка не нужна,
+                # важны только объём и время
+                bytes_received = 0
+                async for chunk in response.content.iter_chunked(65536):
+                    bytes_received += len(chunk)
+                    elapsed_time = time.perf_counter() - start_time
+                    # Достаточно данных для стабильной оценки
+                    if elapsed_time > 0.5 and bytes_received > 512 * 1024:
+                        break
+                else:
+                    elapsed_time = time.perf_counter() - start_time
+
+                speed_mbps = (bytes_received /
+                              (1024 * 1024)) / elapsed_time
+
+                config.speed_mbps = round(speed_mbps, 2)
+                config.status = "ok"
+
+                logger.info(f"✅ {config.server}:{config.server_port} - "
+                            f"Скорость: {config.speed_mbps} MB/s, "
+                            f"Латентность: {config.latency_ms:.1f}ms")
+            else:
+                config.status = "error"
 
         return config
 
     async def check_servers(self, configs: List[VLESSConfig], progress_callback=None) -> List[VLESSConfig]:
         """Проверка списка серверов"""
-        tasks = [self.measure_speed(config, progress_callback)
-                 for config in configs]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        valid_results = [r for r in results if isinstance(r, VLESSConfig)]
-        return valid_results
+        if self._sem is None:
+            self._sem = asyncio.Semaphore(self.concurrency)
+
+        if sys.version_info >= (3, 12):
+            # Первый await каждой задачи выполняется сразу, без лишнего
+            # прохода через планировщик
+            asyncio.get_running_loop().set_task_factory(
+                asyncio.eager_task_factory)
+
+        # Два этапа: широкий fan-out пингов отсеивает недоступные серверы
+        # за секунды, замер скорости идёт только по живым и с меньшей
+        # конкуренцией за полосу. measure_speed перехватывает свои
+        # исключения, поэтому фильтровать результаты не нужно.
+        try:
+            reachable = await self._pre_flight(configs, progress_callback)
+
+            if reachable and progress_callback:
+                progress_callback(
+                    f"Доступно {len(reachable)} из {len(configs)}, "
+                    f"замер скорости...")
+
+            await self._run_all([self.measure_speed(config, progress_callback)
+                                 for config in reachable])
+        finally:
+            await self.close()
+        return list(configs)
 
 
 def filter_servers(results: List[VLESSConfig],
                    max_speed_mbps: Optional[float] = None,
                    min_speed_mbps: Optional[float] = None) -> List[VLESSConfig]:
     """Фильтрация серверов по скорости"""
-    filtered = [r for r in results if r.status == "ok"]
-
-    if max_speed_mbps is not None:
-        filtered = [r for r in filtered if r.speed_mbps < max_speed_mbps]
-
-    if min_speed_mbps is not None:
-        filtered = [r for r in filtered if r.speed_mbps > min_speed_mbps]
+    # Один проход по результатам вместо трёх промежуточных списков
+    filtered = [r for r in results
+                if r.status == "ok"
+                and (max_speed_mbps is None or r.speed_mbps < max_speed_mbps)
+                and (min_speed_mbps is None or r.speed_mbps > min_speed_mbps)]
 
     # Сортировка от БОЛЬШЕЙ скорости к МЕНЬШЕЙ
-    filtered.sort(key=lambda x: x.speed_mbps, reverse=True)
+    filtered.sort(key=operator.attrgetter('speed_mbps'), reverse=True)
     return filtered
 
 
-def save_results(results: List[VLESSConfig], prefix: str = "vless_results"):
-    """Сохранение результатов с сортировкой от большей скорости к меньшей"""
-    # Сортируем от большей скорости к меньшей
-    sorted_results = sorted(results, key=lambda x: x.speed_mbps, reverse=True)
+def _write_result_files(json_filename: str, txt_filename: str,
+                        sorted_results: List[VLESSConfig]):
+    """Синхронная запись файлов результатов (выполняется в потоке)"""
+    json_data = [r.to_dict() for r in sorted_results]
 
-    json_data = [asdict(r) for r in sorted_results]
+    with open(json_filename, 'wb') as f:
+        f.write(json_dumps(json_data))
 
-    json_filename = f"{prefix}.json"
-    with open(json_filename, 'w', encoding='utf-8') as f:
-        json.dump(json_data, f, indent=2, ensure_ascii=False)
+    # Собираем весь отчёт в памяти и пишем одним вызовом вместо
+    # ~11 мелких f.write() на каждый результат
+    parts = ["VLESS Server Check Results (от большей скорости к меньшей)\n",
+             "=" * 80 + "\n\n"]
+
+    for i, r in enumerate(sorted_results, 1):
+        parts.append(f"#{i} Rank\n"
+                     f"Server: {r.server}:{r.server_port}\n"
+                     f"Tag: {r.tag}\n"
+                     f"Speed: {r.speed_mbps} MB/s ⭐\n"
+                     f"Latency: {r.latency_ms:.1f} ms\n"
+                     f"Status: {r.status}\n"
+                     f"UUID: {r.uuid}\n"
+                     f"SNI: {r.server_name}\n"
+                     f"Path: {r.path}\n"
+                     + "-" * 80 + "\n\n")
 
-    txt_filename = f"{prefix}.txt"
     with open(txt_filename, 'w', encoding='utf-8') as f:
-        f.write("VLESS Server Check Results (от большей скорости к меньшей)\n")
-        f.write("=" * 80 + "\n\n")
-
-        for i, r in enumerate(sorted_results, 1):
-            f.write(f"#{i} Rank\n")
-            f.write(f"Server: {r.server}:{r.server_port}\n")
-            f.write(f"Tag: {r.tag}\n")
-            f.write(f"Speed: {r.speed_mbps} MB/s ⭐\n")
-            f.write(f"Latency: {r.latency_ms:.1f} ms\n")
-            f.write(f"Status: {r.status}\n")
-            f.write(f"UUID: {r.uuid}\n")
-            f.write(f"SNI: {r.server_name}\n")
-            f.write(f"Path: {r.path}\n")
-            f.write("-" * 80 + "\n\n")
+        f.write(''.join(parts))
+
+
+async def save_results(results: List[VLESSConfig], prefix: str = "vless_results",
+                       presorted: bool = False):
+    """Сохранение результатов с сортировкой от большей скорости к меньшей"""
+    if presorted:
+        # Вызывающий уже отсортировал список — не сортируем повторно
+        sorted_results = results
+    else:
+        # Сортируем от большей скорости к меньшей
+        sorted_results = sorted(
+            results, key=operator.attrgetter('speed_mbps'), reverse=True)
+
+    json_filename = f"{prefix}.json"
+    txt_filename = f"{prefix}.txt"
+
+    # Файловый ввод-вывод уходит в поток, чтобы не замораживать UI
+    await asyncio.to_thread(
+        _write_result_files, json_filename, txt_filename, sorted_results)
 
     return json_filename, txt_filename
 
 
+# Стили карточек по статусу: (цвет, иконка, подпись, фон иконки)
+_STATUS_STYLE = {
+    "ok": (ft.Colors.GREEN_400, ft.Icons.CHECK_CIRCLE_ROUNDED, "Работает",
+           ft.Colors.with_opacity(0.1, ft.Colors.GREEN_400)),
+    "unreachable": (ft.Colors.RED_400, ft.Icons.CANCEL_ROUNDED, "Недоступен",
+                    ft.Colors.with_opacity(0.1, ft.Colors.RED_400)),
+    "timeout": (ft.Colors.ORANGE_400, ft.Icons.ACCESS_TIME_ROUNDED, "Таймаут",
+                ft.Colors.with_opacity(0.1, ft.Colors.ORANGE_400)),
+}
+_ERROR_STYLE = (ft.Colors.RED_300, ft.Icons.WARNING_ROUNDED, "Ошибка",
+                ft.Colors.with_opacity(0.1, ft.Colors.RED_300))
+
+# Бейджи для топ-3 успешных: (иконка, цвет)
+_RANK_STYLE = (
+    (ft.Icons.MILITARY_TECH_ROUNDED, ft.Colors.AMBER_400),
+    (ft.Icons.WORKSPACE_PREMIUM_ROUNDED, ft.Colors.GREY_400),
+    (ft.Icons.STAR_ROUNDED, ft.Colors.ORANGE_300),
+)
+
+
 class VLESSCheckerApp:
     def __init__(self, page: ft.Page):
         self.page = page
@@ -170,6 +402,20 @@ class VLESSCheckerApp:
         self.checker = None
         self.results = []
 
+        # Пул карточек результатов: переиспользуем контролы между
+        # проверками вместо пересоздания тысяч объектов
+        self._card_pool: List[ft.Container] = []
+
+        # Очередь прогресс-сообщений во время проверки
+        self._progress_queue: Optional[asyncio.Queue] = None
+
+        # Кэш фильтрации по порогам; сбрасывается при новых результатах
+        self._filter_cache: Dict[Tuple[Optional[float], Optional[float]],
+                                 List[VLESSConfig]] = {}
+
+        # Результаты последней проверки, уже отсортированные по скорости
+        self._sorted_results: List[VLESSConfig] = []
+
         # UI Components
         self.servers_input = ft.TextField(
             label="IP:Port список (один на строку)",
@@ -387,21 +633,54 @@ class VLESSCheckerApp:
         """Парсинг списка серверов"""
         servers = []
         for line in text.strip().split('\n'):
-            line = line.strip()
-            if not line or ':' not in line:
+            # Разделяем по последнему двоеточию — хост с лишними
+            # двоеточиями (IPv6) не ломает парсинг
+            host, sep, port = line.strip().rpartition(':')
+            if not sep:
                 continue
             try:
-                ip, port = line.split(':')
-                servers.append((ip.strip(), int(port.strip())))
+                port_int = int(port)
             except ValueError:
                 continue
+            servers.append((host.strip(), port_int))
         return servers
 
+    def filter_results(self,
+                       max_speed_mbps: Optional[float],
+                       min_speed_mbps: Optional[float]) -> List[VLESSConfig]:
+        """Фильтрация текущих результатов с кэшем по порогам"""
+        key = (max_speed_mbps, min_speed_mbps)
+        cached = self._filter_cache.get(key)
+        if cached is None:
+            cached = filter_servers(
+                self.results, max_speed_mbps, min_speed_mbps)
+            self._filter_cache[key] = cached
+        return cached
+
     def update_status(self, message: str):
         """Обновление статуса"""
+        # Во время проверки сообщения идут через очередь, чтобы N
+        # конкурентных задач не устраивали N полных обновлений страницы
+        if self._progress_queue is not None:
+            self._progress_queue.put_nowait(message)
+            return
         self.status_text.value = message
         self.page.update()
 
+    async def _progress_pump(self):
+        """Коалесцирование прогресс-сообщений: не чаще 10 обновлений/сек"""
+        try:
+            while True:
+                message = await self._progress_queue.get()
+                # Показываем только последнее из накопившихся
+                while not self._progress_queue.empty():
+                    message = self._progress_queue.get_nowait()
+                self.status_text.value = message
+                self.page.update()
+                await asyncio.sleep(0.1)
+        except asyncio.CancelledError:
+            pass
+
     async def start_check(self, e):
         """Начать проверку"""
         servers = self.parse_servers(self.servers_input.value)
@@ -435,7 +714,16 @@ class VLESSCheckerApp:
 
         self.update_status(f"Проверка {len(configs)} серверов...")
 
-        self.results = await self.checker.check_servers(configs, self.update_status)
+        self._progress_queue = asyncio.Queue()
+        pump_task = asyncio.create_task(self._progress_pump())
+        try:
+            self.results = await self.checker.check_servers(configs, self.update_status)
+        finally:
+            self._progress_queue = None
+            pump_task.cancel()
+
+        # Новые результаты — старые отфильтрованные списки неактуальны
+        self._filter_cache.clear()
 
         # Фильтруем результаты (только для отображения успешных с фильтром)
         max_speed = float(
@@ -448,11 +736,13 @@ class VLESSCheckerApp:
         successful = [r for r in self.results if r.status == "ok"]
         failed = [r for r in self.results if r.status != "ok"]
 
-        successful.sort(key=lambda x: x.speed_mbps, reverse=True)
+        successful.sort(key=operator.attrgetter('speed_mbps'), reverse=True)
         all_sorted = successful + failed
+        # Запоминаем — сохранение сможет пропустить повторную сортировку
+        self._sorted_results = all_sorted
 
         # Отфильтрованные для статистики
-        filtered = filter_servers(self.results, max_speed, min_speed)
+        filtered = self.filter_results(max_speed, min_speed)
 
         # Отображаем ВСЕ результаты
         self.display_results(all_sorted)
@@ -486,12 +776,143 @@ class VLESSCheckerApp:
         self.save_filtered_btn.disabled = False
         self.page.update()
 
+    def _build_card(self) -> ft.Container:
+        """Создание пустой карточки результата для пула"""
+        status_icon = ft.Icon(ft.Icons.HELP_OUTLINE,
+                              color=ft.Colors.GREY_500, size=32)
+        status_icon_box = ft.Container(
+            content=status_icon,
+            padding=10,
+            border_radius=8,
+        )
+        index_text = ft.Text(
+            "", size=14, color=ft.Colors.GREY_500, weight=ft.FontWeight.W_600)
+        server_text = ft.Text(
+            "", size=16, weight=ft.FontWeight.W_600, color=ft.Colors.WHITE)
+        rank_badge = ft.Icon(ft.Icons.STAR_ROUNDED, size=24, visible=False)
+        tag_text = ft.Text("", size=12, color=ft.Colors.GREY_500)
+        speed_text = ft.Text(
+            "", size=15, weight=ft.FontWeight.W_600, color=ft.Colors.BLUE_300)
+        latency_text = ft.Text(
+            "", size=15, weight=ft.FontWeight.W_600, color=ft.Colors.ORANGE_300)
+        status_label = ft.Text("", size=15, weight=ft.FontWeight.W_600)
+
+        card = ft.Container(
+            content=ft.Row([
+                # Левая часть - статус иконка
+                status_icon_box,
+                # Средняя часть - информация
+                ft.Container(
+                    content=ft.Column([
+                        ft.Row([
+                            index_text,
+                            server_text,
+                            rank_badge,
+                        ], spacing=8),
+                        tag_text,
+                    ], spacing=4),
+                    expand=True,
+                ),
+                # Правая часть - метрики
+                ft.Container(
+                    content=ft.Row([
+                        # Скорость
+                        ft.Container(
+                            content=ft.Column([
+                                ft.Row([
+                                    ft.Icon(ft.Icons.SPEED, size=16,
+                                            color=ft.Colors.BLUE_300),
+                                    ft.Text("Скорость", size=11,
+                                            color=ft.Colors.GREY_500),
+                                ], spacing=4),
+                                speed_text,
+                            ], spacing=2, horizontal_alignment=ft.CrossAxisAlignment.CENTER),
+                            padding=10,
+                            border_radius=8,
+                            bgcolor=ft.Colors.with_opacity(
+                                0.1, ft.Colors.BLUE_300),
+                        ),
+                        # Латентность
+                        ft.Container(
+                            content=ft.Column([
+                                ft.Row([
+                                    ft.Icon(
+                                        ft.Icons.NETWORK_PING, size=16, color=ft.Colors.ORANGE_300),
+                                    ft.Text("Пинг", size=11,
+                                            color=ft.Colors.GREY_500),
+                                ], spacing=4),
+                                latency_text,
+                            ], spacing=2, horizontal_alignment=ft.CrossAxisAlignment.CENTER),
+                            padding=10,
+                            border_radius=8,
+                            bgcolor=ft.Colors.with_opacity(
+                                0.1, ft.Colors.ORANGE_300),
+                        ),
+                        # Статус
+                        ft.Container(
+                            content=ft.Column([
+                                ft.Text("Статус", size=11,
+                                        color=ft.Colors.GREY_500),
+                                status_label,
+                            ], spacing=2, horizontal_alignment=ft.CrossAxisAlignment.CENTER),
+                            padding=10,
+                            border_radius=8,
+                        ),
+                    ], spacing=10),
+                ),
+            ], spacing=15),
+            padding=15,
+            border_radius=12,
+            bgcolor=ft.Colors.SURFACE,
+            border=ft.border.all(
+                1, ft.Colors.with_opacity(0.1, ft.Colors.WHITE)),
+        )
+        # Ссылки на изменяемые контролы для обновления на месте
+        card.data = {
+            'status_icon': status_icon,
+            'status_icon_box': status_icon_box,
+            'index_text': index_text,
+            'server_text': server_text,
+            'rank_badge': rank_badge,
+            'tag_text': tag_text,
+            'speed_text': speed_text,
+            'latency_text': latency_text,
+            'status_label': status_label,
+        }
+        return card
+
+    def _update_card(self, card: ft.Container, i: int, r: VLESSConfig):
+        """Обновление карточки из пула под конкретный результат"""
+        # Цвета и иконки в зависимости от статуса
+        color, icon, status_text, bg_color = _STATUS_STYLE.get(
+            r.status, _ERROR_STYLE)
+
+        refs = card.data
+        refs['status_icon'].name = icon
+        refs['status_icon'].color = color
+        refs['status_icon_box'].bgcolor = bg_color
+        refs['index_text'].value = f"#{i}"
+        refs['server_text'].value = f"{r.server}:{r.server_port}"
+        refs['tag_text'].value = r.tag
+        refs['speed_text'].value = (
+            f"{r.speed_mbps} MB/s" if r.status == "ok" else "—")
+        refs['latency_text'].value = (
+            f"{r.latency_ms:.0f} ms" if r.latency_ms > 0 else "—")
+        refs['status_label'].value = status_text
+        refs['status_label'].color = color
+
+        # Бейдж для топ-3 успешных
+        rank_badge = refs['rank_badge']
+        if r.status == "ok" and i <= 3:
+            rank_badge.name, rank_badge.color = _RANK_STYLE[i - 1]
+            rank_badge.visible = True
+        else:
+            rank_badge.visible = False
+
     def display_results(self, results: List[VLESSConfig]):
         """Отображение результатов"""
-        self.results_list.controls.clear()
-
         if not results:
-            self.results_list.controls.append(
+            self.results_list.controls[:] = [
                 ft.Container(
                     content=ft.Column([
                         ft.Icon(ft.Icons.SEARCH_OFF, size=64,
@@ -506,165 +927,35 @@ class VLESSCheckerApp:
                     alignment=ft.alignment.center,
                     padding=50,
                 )
-            )
+            ]
         else:
+            # Пул растёт только когда результатов больше, чем карточек
+            while len(self._card_pool) < len(results):
+                self._card_pool.append(self._build_card())
+
             for i, r in enumerate(results, 1):
-                # Цвета и иконки в зависимости от статуса
-                if r.status == "ok":
-                    color = ft.Colors.GREEN_400
-                    icon = ft.Icons.CHECK_CIRCLE_ROUNDED
-                    status_text = "Работает"
-                    bg_color = ft.Colors.with_opacity(0.1, ft.Colors.GREEN_400)
-                elif r.status == "unreachable":
-                    color = ft.Colors.RED_400
-                    icon = ft.Icons.CANCEL_ROUNDED
-                    status_text = "Недоступен"
-                    bg_color = ft.Colors.with_opacity(0.1, ft.Colors.RED_400)
-                elif r.status == "timeout":
-                    color = ft.Colors.ORANGE_400
-                    icon = ft.Icons.ACCESS_TIME_ROUNDED
-                    status_text = "Таймаут"
-                    bg_color = ft.Colors.with_opacity(
-                        0.1, ft.Colors.ORANGE_400)
-                else:  # error
-                    color = ft.Colors.RED_300
-                    icon = ft.Icons.WARNING_ROUNDED
-                    status_text = "Ошибка"
-                    bg_color = ft.Colors.with_opacity(0.1, ft.Colors.RED_300)
-
-                # Бейдж для топ-3 успешных
-                rank_badge = None
-                if r.status == "ok" and i <= 3:
-                    if i == 1:
-                        rank_icon = ft.Icons.MILITARY_TECH_ROUNDED
-                        rank_color = ft.Colors.AMBER_400
-                    elif i == 2:
-                        rank_icon = ft.Icons.WORKSPACE_PREMIUM_ROUNDED
-                        rank_color = ft.Colors.GREY_400
-                    else:  # 3
-                        rank_icon = ft.Icons.STAR_ROUNDED
-                        rank_color = ft.Colors.ORANGE_300
-
-                    rank_badge = ft.Icon(rank_icon, size=24, color=rank_color)
-
-                card = ft.Container(
-                    content=ft.Row([
-                        # Левая часть - статус иконка
-                        ft.Container(
-                            content=ft.Icon(icon, color=color, size=32),
-                            padding=10,
-                            border_radius=8,
-                            bgcolor=bg_color,
-                        ),
-                        # Средняя часть - информация
-                        ft.Container(
-                            content=ft.Column([
-                                ft.Row([
-                                    ft.Text(
-                                        f"#{i}",
-                                        size=14,
-                                        color=ft.Colors.GREY_500,
-                                        weight=ft.FontWeight.W_600,
-                                    ),
-                                    ft.Text(
-                                        f"{r.server}:{r.server_port}",
-                                        size=16,
-                                        weight=ft.FontWeight.W_600,
-                                        color=ft.Colors.WHITE,
-                                    ),
-                                    rank_badge if rank_badge else ft.Container(),
-                                ], spacing=8),
-                                ft.Text(
-                                    r.tag,
-                                    size=12,
-                                    color=ft.Colors.GREY_500,
-                                ),
-                            ], spacing=4),
-                            expand=True,
-                        ),
-                        # Правая часть - метрики
-                        ft.Container(
-                            content=ft.Row([
-                                # Скорость
-                                ft.Container(
-                                    content=ft.Column([
-                                        ft.Row([
-                                            ft.Icon(ft.Icons.SPEED, size=16,
-                                                    color=ft.Colors.BLUE_300),
-                                            ft.Text("Скорость", size=11,
-                                                    color=ft.Colors.GREY_500),
-                                        ], spacing=4),
-                                        ft.Text(
-                                            f"{r.speed_mbps} MB/s" if r.status == "ok" else "—",
-                                            size=15,
-                                            weight=ft.FontWeight.W_600,
-                                            color=ft.Colors.BLUE_300,
-                                        ),
-                                    ], spacing=2, horizontal_alignment=ft.CrossAxisAlignment.CENTER),
-                                    padding=10,
-                                    border_radius=8,
-                                    bgcolor=ft.Colors.with_opacity(
-                                        0.1, ft.Colors.BLUE_300),
-                                ),
-                                # Латентность
-                                ft.Container(
-                                    content=ft.Column([
-                                        ft.Row([
-                                            ft.Icon(
-                                                ft.Icons.NETWORK_PING, size=16, color=ft.Colors.ORANGE_300),
-                                            ft.Text("Пинг", size=11,
-                                                    color=ft.Colors.GREY_500),
-                                        ], spacing=4),
-                                        ft.Text(
-                                            f"{r.latency_ms:.0f} ms" if r.latency_ms > 0 else "—",
-                                            size=15,
-                                            weight=ft.FontWeight.W_600,
-                                            color=ft.Colors.ORANGE_300,
-                                        ),
-                                    ], spacing=2, horizontal_alignment=ft.CrossAxisAlignment.CENTER),
-                                    padding=10,
-                                    border_radius=8,
-                                    bgcolor=ft.Colors.with_opacity(
-                                        0.1, ft.Colors.ORANGE_300),
-                                ),
-                                # Статус
-                                ft.Container(
-                                    content=ft.Column([
-                                        ft.Text("Статус", size=11,
-                                                color=ft.Colors.GREY_500),
-                                        ft.Text(
-                                            status_text,
-                                            size=15,
-                                            weight=ft.FontWeight.W_600,
-                                            color=color,
-                                        ),
-                                    ], spacing=2, horizontal_alignment=ft.CrossAxisAlignment.CENTER),
-                                    padding=10,
-                                    border_radius=8,
-                                ),
-                            ], spacing=10),
-                        ),
-                    ], spacing=15),
-                    padding=15,
-                    border_radius=12,
-                    bgcolor=ft.Colors.SURFACE,
-                    border=ft.border.all(
-                        1, ft.Colors.with_opacity(0.1, ft.Colors.WHITE)),
-                )
-                self.results_list.controls.append(card)
+                self._update_card(self._card_pool[i - 1], i, r)
 
-        self.page.update()
+            self.results_list.controls[:] = self._card_pool[:len(results)]
 
-    def save_all_results(self, e):
+        # Обновляем только список результатов, а не всю страницу
+        self.results_list.update()
+
+    async def save_all_results(self, e):
         """Сохранить все результаты"""
         if not self.results:
             return
 
-        json_file, txt_file = save_results(self.results, "all_vless_results")
+        if self._sorted_results:
+            json_file, txt_file = await save_results(
+                self._sorted_results, "all_vless_results", presorted=True)
+        else:
+            json_file, txt_file = await save_results(
+                self.results, "all_vless_results")
         self.show_dialog(
             "Успех", f"Результаты сохранены (от быстрых к медленным):\n{json_file}\n{txt_file}")
 
-    def save_filtered_results(self, e):
+    async def save_filtered_results(self, e):
         """Сохранить отфильтрованные результаты"""
         if not self.results:
             return
@@ -674,13 +965,15 @@ class VLESSCheckerApp:
         min_speed = float(
             self.min_speed_input.value) if self.min_speed_input.value else None
 
-        filtered = filter_servers(self.results, max_speed, min_speed)
+        filtered = self.filter_results(max_speed, min_speed)
 
         if not filtered:
             self.show_dialog("Предупреждение", "Нет серверов для сохранения")
             return
 
-        json_file, txt_file = save_results(filtered, "filtered_vless_servers")
+        # filter_servers уже отсортировал список по скорости
+        json_file, txt_file = await save_results(
+            filtered, "filtered_vless_servers", presorted=True)
         self.show_dialog(
             "Успех", f"Отфильтрованные результаты сохранены (от быстрых к медленным):\n{json_file}\n{txt_file}")
 
@@ -705,8 +998,8 @@ class VLESSCheckerApp:
 
         try:
             file_path = e.files[0].path
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(file_path, 'rb') as f:
+                data = json_loads(f.read())
 
             # Загружаем данные
             if isinstance(data, dict) and 'outbounds' in data:
@@ -793,4 +1086,5 @@ def main(page: ft.Page):
 
 
 if __name__ == "__main__":
+    install_uvloop()
     ft.app(target=main)